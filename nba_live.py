@@ -17,27 +17,331 @@ This module exposes reusable helpers for working with NBA statistics via the
 The helpers are designed to be imported elsewhere in the application while also
 supporting basic command-line usage for manual inspection and lightweight
 natural-language interpretation.
+
+Helper results are cached per process for a short TTL. Each call returns its
+own top-level dictionary, but nested lists and dictionaries are shared with
+the cache and must not be modified in place.
 """
 
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
+import inspect
 import json
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any, Dict, Mapping, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+# ``nba_api.stats.endpoints`` imports pandas and every stats endpoint, so each
+# stats helper imports its endpoint lazily to keep ``--scores`` start-up cheap.
+from nba_api.library import http as nba_http
 from nba_api.live.nba.endpoints import scoreboard
-from nba_api.stats.endpoints import (
-    leaguedashplayerstats,
-    playercareerstats,
-    playerdashboardbygeneralsplits,
-    teamdashboardbygeneralsplits,
-)
 from nba_api.stats.library.http import NBAStatsHTTPException
-from requests import RequestException
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Dashboard columns surfaced by :func:`get_player_prop_recommendations`, mapped
+# to their output keys, the defaults used when a value is missing, and the
+# dtypes the numeric columns are cast to before export.
+_PROP_COLUMNS = {
+    "PLAYER_ID": "playerId",
+    "PLAYER_NAME": "playerName",
+    "TEAM_ID": "teamId",
+    "TEAM_ABBREVIATION": "team",
+    "PTS": "points",
+    "REB": "rebounds",
+    "AST": "assists",
+    "USG_PCT": "usagePct",
+}
+_PROP_DEFAULTS = {
+    "PLAYER_ID": 0,
+    "PLAYER_NAME": "Unknown",
+    "TEAM_ID": 0,
+    "TEAM_ABBREVIATION": "",
+    "PTS": 0.0,
+    "REB": 0.0,
+    "AST": 0.0,
+    "USG_PCT": 0.0,
+}
+_PROP_DTYPES = {
+    "PLAYER_ID": "int64",
+    "TEAM_ID": "int64",
+    "PTS": "float64",
+    "REB": "float64",
+    "AST": "float64",
+    "USG_PCT": "float64",
+}
+
+
+def _build_session() -> Session:
+    """Create the pooled, retrying HTTP session shared by every endpoint."""
+
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def _install_session(session: Session) -> None:
+    """Route ``nba_api`` stats and live requests through ``session``.
+
+    Recent ``nba_api`` releases expose ``NBAHTTP.set_session``; older ones call
+    ``requests.get`` from :mod:`nba_api.library.http`, so the module-level
+    ``requests`` reference is swapped for the session instead. The endpoint
+    specific headers are still sent by ``nba_api`` on each request.
+    """
+
+    if hasattr(nba_http.NBAHTTP, "set_session"):
+        nba_http.NBAHTTP.set_session(session)
+    else:
+        nba_http.requests = session
+
 
+def _install_json_parser() -> None:
+    """Parse ``nba_api`` response bodies with :mod:`orjson` when available.
+
+    Every live and stats endpoint decodes its payload through
+    ``NBAResponse.get_dict`` (including ``get_normalized_dict`` and
+    ``get_data_frames``), so replacing it covers all of the helpers. Without
+    ``orjson`` the stdlib parser is left in place.
+    """
+
+    if orjson is None:
+        return
+
+    def get_dict(response: nba_http.NBAResponse) -> Dict[str, Any]:
+        return orjson.loads(response.get_response())
+
+    nba_http.NBAResponse.get_dict = get_dict
+
+
+_SESSION = _build_session()
+_install_session(_SESSION)
+_install_json_parser()
+
+# The helpers are bound by HTTPS round-trips, which release the GIL, so
+# independent lookups can overlap on a small shared pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nba_live")
+
+_INT_RE = re.compile(r"\d+")
+
+# Keyword bits recognised by :func:`handle_nba_query`. Keywords match as
+# substrings of the lower-cased query, so plurals, longer forms and run-together
+# words ("stats", "careers", "livescores") still count. Anything matching no
+# intent falls back to prop recommendations. "nba" is checked on its own before
+# the table so rejected queries skip the remaining scans.
+_NBA = 1 << 0
+_LIVE = 1 << 1
+_SCORE = 1 << 2
+_TEAM = 1 << 3
+_STAT = 1 << 4
+_PLAYER = 1 << 5
+_CAREER = 1 << 6
+
+_KEYWORD_FLAGS = (
+    ("live", _LIVE),
+    ("score", _SCORE),
+    ("team", _TEAM),
+    ("stat", _STAT),
+    ("player", _PLAYER),
+    ("career", _CAREER),
+)
+
+_LIVE_SCORES = _LIVE | _SCORE
+_TEAM_STATS = _TEAM | _STAT
+_PLAYER_CAREER = _PLAYER | _CAREER
+_PLAYER_STATS = _PLAYER | _STAT
+
+_MISSING_ID_HINT = "Include an ID or ask for 'props'."
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _TTLCache:
+    """Thread-safe, process-local LRU cache whose entries expire after a TTL.
+
+    At most ``max_entries`` values are kept. When a new key would exceed the
+    bound, expired entries are swept first and then the least recently used
+    entries are evicted, so arbitrary user-supplied IDs cannot grow it forever.
+    """
 
+    def __init__(self, max_entries: int = 256) -> None:
+        self._entries: Dict[Hashable, tuple[float, Any]] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return ``(hit, value)`` for ``key``, evicting it if expired."""
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False, None
+            expiry, value = entry
+            if expiry <= now:
+                return False, None
+            # Re-insert to mark the entry as most recently used.
+            self._entries[key] = entry
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._max_entries:
+                expired = [
+                    k for k, (expiry, _) in self._entries.items() if expiry <= now
+                ]
+                for stale in expired:
+                    del self._entries[stale]
+                while len(self._entries) >= self._max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, value)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+_CACHE = _TTLCache()
+
+
+def _memoize(ttl: float) -> Callable[[_F], _F]:
+    """Cache a helper's successful results in :data:`_CACHE` for ``ttl`` seconds.
+
+    Entries are keyed on the function name and its call arguments, bound to the
+    signature with defaults applied so equivalent calls share one entry.
+    Failures are not cached. Callers receive a shallow copy of the cached
+    payload, so top-level changes stay local while nested values are shared.
+    """
+
+    def decorator(func: _F) -> _F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, tuple(bound.arguments.items()))
+            hit, value = _CACHE.get(key)
+            if not hit:
+                value = func(*args, **kwargs)
+                _CACHE.set(key, value, ttl)
+            return copy.copy(value)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Projections applied to dashboard rows: output key -> (source, caster, default).
+_TEAM_FIELDS: Mapping[str, tuple[str, type, Any]] = {
+    "wins": ("W", int, 0),
+    "losses": ("L", int, 0),
+    "winPct": ("W_PCT", float, 0.0),
+    "points": ("PTS", float, 0.0),
+    "rebounds": ("REB", float, 0.0),
+    "assists": ("AST", float, 0.0),
+    "steals": ("STL", float, 0.0),
+    "blocks": ("BLK", float, 0.0),
+    "turnovers": ("TOV", float, 0.0),
+    "plusMinus": ("PLUS_MINUS", float, 0.0),
+}
+_PLAYER_FIELDS: Mapping[str, tuple[str, type, Any]] = {
+    "points": ("PTS", float, 0.0),
+    "rebounds": ("REB", float, 0.0),
+    "assists": ("AST", float, 0.0),
+    "steals": ("STL", float, 0.0),
+    "blocks": ("BLK", float, 0.0),
+    "turnovers": ("TOV", float, 0.0),
+    "fieldGoalPct": ("FG_PCT", float, 0.0),
+    "threePointPct": ("FG3_PCT", float, 0.0),
+    "freeThrowPct": ("FT_PCT", float, 0.0),
+    "plusMinus": ("PLUS_MINUS", float, 0.0),
+}
+
+
+def _compile_extractor(
+    mapping: Mapping[str, tuple[str, type, Any]],
+) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """Generate a function that projects and casts ``mapping`` from an API row.
+
+    The field loop is unrolled into straight-line code at import time. Missing
+    or ``None`` values use the field default, as do values the caster rejects.
+    Identical mappings share one compiled extractor.
+    """
+
+    return _compile_fields(tuple(mapping.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_fields(
+    fields: tuple[tuple[str, tuple[str, type, Any]], ...],
+) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """Compile the extractor for ``fields``; order is kept for output keys."""
+
+    namespace: Dict[str, Any] = {}
+    lines = ["def _extract(row):", "    get = row.get", "    extracted = {}"]
+    for index, (key, (source, caster, default)) in enumerate(fields):
+        cast_name, default_name = f"_cast{index}", f"_default{index}"
+        namespace[cast_name] = caster
+        namespace[default_name] = default
+        lines += [
+            f"    value = get({source!r}, {default_name})",
+            "    try:",
+            f"        extracted[{key!r}] = {cast_name}(",
+            f"            {default_name} if value is None else value",
+            "        )",
+            "    except (TypeError, ValueError):",
+            f"        extracted[{key!r}] = {default_name}",
+        ]
+    lines.append("    return extracted")
+    exec(compile("\n".join(lines), "<nba_live extractor>", "exec"), namespace)
+    return namespace["_extract"]
+
+
+_TEAM_EXTRACTOR = _compile_extractor(_TEAM_FIELDS)
+_PLAYER_EXTRACTOR = _compile_extractor(_PLAYER_FIELDS)
+
+
+@_memoize(ttl=15)
 def get_live_scores() -> Dict[str, Any]:
     """Fetch today's NBA games and return their current status.
 
@@ -58,36 +362,32 @@ def get_live_scores() -> Dict[str, Any]:
     try:
         board = scoreboard.ScoreBoard()
         board_data = board.get_dict()
-        games_payload = board_data.get("scoreboard", {}).get("games", [])
-        games: list[Dict[str, Any]] = []
-
-        for game in games_payload:
-            home_team = game.get("homeTeam", {})
-            away_team = game.get("awayTeam", {})
-            home_team_name = home_team.get("teamTricode", "N/A")
-            away_team_name = away_team.get("teamTricode", "N/A")
-
-            home_score = home_team.get("score", "0")
-            away_score = away_team.get("score", "0")
-
-            game_status_text = game.get("gameStatusText", "Unknown")
-
-            games.append(
-                {
-                    "gameId": game.get("gameId"),
-                    "homeTeam": home_team_name,
-                    "awayTeam": away_team_name,
-                    "homeScore": home_score,
-                    "awayScore": away_score,
-                    "status": game_status_text,
-                }
-            )
+        games_payload = (board_data.get("scoreboard") or {}).get("games") or []
+        # Each team dict is bound once; ``.get`` itself is deliberately not
+        # hoisted into locals, as CPython 3.11+ specialises direct method calls
+        # and the hoisted form measured slower.
+        games = [
+            {
+                "gameId": game.get("gameId"),
+                "homeTeam": (home := game.get("homeTeam") or {}).get(
+                    "teamTricode", "N/A"
+                ),
+                "awayTeam": (away := game.get("awayTeam") or {}).get(
+                    "teamTricode", "N/A"
+                ),
+                "homeScore": home.get("score", "0"),
+                "awayScore": away.get("score", "0"),
+                "status": game.get("gameStatusText", "Unknown"),
+            }
+            for game in games_payload
+        ]
 
         return {"games": games}
     except (RequestException, NBAStatsHTTPException) as exc:
         raise RuntimeError("Failed to fetch live NBA scores") from exc
 
 
+@_memoize(ttl=600)
 def get_team_statistics(
     team_id: int,
     *,
@@ -115,6 +415,8 @@ def get_team_statistics(
 
     target_season = season or _current_season()
 
+    from nba_api.stats.endpoints import teamdashboardbygeneralsplits
+
     try:
         dashboard = teamdashboardbygeneralsplits.TeamDashboardByGeneralSplits(
             team_id=team_id,
@@ -136,21 +438,7 @@ def get_team_statistics(
         }
 
     row = team_dashboard[0]
-    averages = _extract_fields(
-        row,
-        {
-            "wins": ("W", int, 0),
-            "losses": ("L", int, 0),
-            "winPct": ("W_PCT", float, 0.0),
-            "points": ("PTS", float, 0.0),
-            "rebounds": ("REB", float, 0.0),
-            "assists": ("AST", float, 0.0),
-            "steals": ("STL", float, 0.0),
-            "blocks": ("BLK", float, 0.0),
-            "turnovers": ("TOV", float, 0.0),
-            "plusMinus": ("PLUS_MINUS", float, 0.0),
-        },
-    )
+    averages = _TEAM_EXTRACTOR(row)
 
     return {
         "teamId": team_id,
@@ -161,6 +449,7 @@ def get_team_statistics(
     }
 
 
+@_memoize(ttl=600)
 def get_player_statistics(
     player_id: int,
     *,
@@ -188,6 +477,8 @@ def get_player_statistics(
 
     target_season = season or _current_season()
 
+    from nba_api.stats.endpoints import playerdashboardbygeneralsplits
+
     try:
         dashboard = (
             playerdashboardbygeneralsplits.PlayerDashboardByGeneralSplits(
@@ -211,21 +502,7 @@ def get_player_statistics(
         }
 
     row = player_dashboard[0]
-    averages = _extract_fields(
-        row,
-        {
-            "points": ("PTS", float, 0.0),
-            "rebounds": ("REB", float, 0.0),
-            "assists": ("AST", float, 0.0),
-            "steals": ("STL", float, 0.0),
-            "blocks": ("BLK", float, 0.0),
-            "turnovers": ("TOV", float, 0.0),
-            "fieldGoalPct": ("FG_PCT", float, 0.0),
-            "threePointPct": ("FG3_PCT", float, 0.0),
-            "freeThrowPct": ("FT_PCT", float, 0.0),
-            "plusMinus": ("PLUS_MINUS", float, 0.0),
-        },
-    )
+    averages = _PLAYER_EXTRACTOR(row)
 
     return {
         "playerId": player_id,
@@ -236,6 +513,7 @@ def get_player_statistics(
     }
 
 
+@_memoize(ttl=900)
 def get_player_prop_recommendations(
     *,
     season: Optional[str] = None,
@@ -269,6 +547,8 @@ def get_player_prop_recommendations(
 
     target_season = season or _current_season()
 
+    from nba_api.stats.endpoints import leaguedashplayerstats
+
     try:
         response = leaguedashplayerstats.LeagueDashPlayerStats(
             season=target_season,
@@ -286,27 +566,18 @@ def get_player_prop_recommendations(
             "players": [],
         }
 
-    subset = frame.sort_values(by=["PTS", "REB", "AST"], ascending=False)
-
-    recommendations = []
-    for _, row in subset.head(limit).iterrows():
-        points = float(row.get("PTS", 0.0) or 0.0)
-        rebounds = float(row.get("REB", 0.0) or 0.0)
-        assists = float(row.get("AST", 0.0) or 0.0)
-        prop_score = points + (rebounds * 0.75) + (assists * 0.75)
-        recommendations.append(
-            {
-                "playerId": int(row.get("PLAYER_ID", 0) or 0),
-                "playerName": row.get("PLAYER_NAME", "Unknown"),
-                "teamId": int(row.get("TEAM_ID", 0) or 0),
-                "team": row.get("TEAM_ABBREVIATION", ""),
-                "points": points,
-                "rebounds": rebounds,
-                "assists": assists,
-                "usagePct": float(row.get("USG_PCT", 0.0) or 0.0),
-                "propScore": round(prop_score, 2),
-            }
+    top = (
+        frame.nlargest(limit, ["PTS", "REB", "AST"])
+        .reindex(columns=list(_PROP_COLUMNS))
+        .fillna(_PROP_DEFAULTS)
+        .astype(_PROP_DTYPES)
+        .assign(
+            propScore=lambda d: (
+                d["PTS"] + (d["REB"] * 0.75) + (d["AST"] * 0.75)
+            ).round(2),
         )
+    )
+    recommendations = top.rename(columns=_PROP_COLUMNS).to_dict(orient="records")
 
     return {
         "season": target_season,
@@ -315,6 +586,7 @@ def get_player_prop_recommendations(
     }
 
 
+@_memoize(ttl=3600)
 def get_player_career_stats(player_id: int) -> Dict[str, float]:
     """Fetch a player's career averages using the NBA stats API.
 
@@ -330,20 +602,23 @@ def get_player_career_stats(player_id: int) -> Dict[str, float]:
         assists, and rebounds per game.
     """
 
+    from nba_api.stats.endpoints import playercareerstats
+
     try:
         career = playercareerstats.PlayerCareerStats(player_id=player_id)
-        career_data = career.get_data_frames()[0]
+        data = career.get_normalized_dict()
     except (RequestException, NBAStatsHTTPException) as exc:
         raise RuntimeError("Failed to fetch player career stats") from exc
 
-    if career_data.empty:
+    career_totals = data.get("CareerTotalsRegularSeason", [])
+    season_totals = data.get("SeasonTotalsRegularSeason", [])
+    if career_totals:
+        totals = career_totals[0]
+    elif season_totals:
+        totals = season_totals[-1]
+    else:
         return {"ppg": 0.0, "apg": 0.0, "rpg": 0.0}
 
-    career_row = career_data.loc[career_data["SEASON_ID"] == "Career"]
-    if career_row.empty:
-        career_row = career_data.tail(1)
-
-    totals = career_row.iloc[0]
     games_played = float(totals.get("GP", 0.0) or 0.0)
 
     if games_played <= 0:
@@ -356,14 +631,65 @@ def get_player_career_stats(player_id: int) -> Dict[str, float]:
     }
 
 
+def _requires_id(
+    message: str,
+    fetch: Callable[[int], Dict[str, Any]],
+) -> Callable[[str], Dict[str, Any]]:
+    """Build an intent handler that calls ``fetch`` with the query's first ID."""
+
+    def handler(query: str) -> Dict[str, Any]:
+        identifier = _extract_first_integer(query)
+        if identifier is None:
+            return {"message": message, "hint": _MISSING_ID_HINT}
+        return fetch(identifier)
+
+    return handler
+
+
+def _career_averages(player_id: int) -> Dict[str, Any]:
+    """Wrap :func:`get_player_career_stats` in the query response shape."""
+
+    averages = get_player_career_stats(player_id)
+    return {"playerId": player_id, "careerAverages": averages}
+
+
+# Intents checked in order by :func:`handle_nba_query`: the first whose
+# keyword mask is fully present in the query handles it. Helpers are called
+# through lambdas so they are looked up at call time and stay patchable.
+_INTENTS: tuple[tuple[int, Callable[[str], Dict[str, Any]]], ...] = (
+    (_LIVE_SCORES, lambda query: get_live_scores()),
+    (
+        _TEAM_STATS,
+        _requires_id(
+            "Team stats requested without an explicit ID.",
+            lambda team_id: get_team_statistics(team_id),
+        ),
+    ),
+    (
+        _PLAYER_CAREER,
+        _requires_id(
+            "Player career stats requested without an ID.",
+            lambda player_id: _career_averages(player_id),
+        ),
+    ),
+    (
+        _PLAYER_STATS,
+        _requires_id(
+            "Player stats requested without an ID.",
+            lambda player_id: get_player_statistics(player_id),
+        ),
+    ),
+)
+
+
 def handle_nba_query(query: str) -> Dict[str, Any]:
     """Interpret a natural-language style query and dispatch to a helper.
 
     Any query that references the NBA will return a structured response. The
     interpreter honours explicit requests for scores, team statistics, player
-    statistics, or player career averages while falling back to prop
-    recommendations when the input lacks the identifiers needed for a targeted
-    lookup.
+    statistics, or player career averages. Targeted lookups that lack the
+    identifier they need return a hint rather than extra data, and anything
+    else falls back to prop recommendations.
 
     Parameters
     ----------
@@ -381,90 +707,83 @@ def handle_nba_query(query: str) -> Dict[str, Any]:
         If the query does not contain enough information to map to a helper.
     """
 
-    normalized = " ".join(query.lower().split())
+    flags = _query_flags(query)
 
-    if "nba" not in normalized:
+    if not flags & _NBA:
         raise ValueError("Query does not appear to reference the NBA")
 
-    fallback_payload: Optional[Dict[str, Any]] = None
+    for mask, handler in _INTENTS:
+        if (flags & mask) == mask:
+            return handler(query)
 
-    def _fallback() -> Dict[str, Any]:
-        nonlocal fallback_payload
-        if fallback_payload is None:
-            fallback_payload = get_player_prop_recommendations()
-        return fallback_payload
+    return get_player_prop_recommendations()
 
-    if "live" in normalized and "score" in normalized:
-        return get_live_scores()
 
-    if "team" in normalized and "stat" in normalized:
-        team_id = _extract_first_integer(normalized)
-        if team_id is None:
-            return {
-                "message": "Team stats requested without an explicit ID.",
-                "recommendations": _fallback(),
-            }
-        return get_team_statistics(team_id)
-
-    if "player" in normalized and "career" in normalized:
-        player_id = _extract_first_integer(normalized)
-        if player_id is None:
-            return {
-                "message": "Player career stats requested without an ID.",
-                "recommendations": _fallback(),
-            }
-        averages = get_player_career_stats(player_id)
-        return {"playerId": player_id, "careerAverages": averages}
-
-    if "player" in normalized and "stat" in normalized:
-        player_id = _extract_first_integer(normalized)
-        if player_id is None:
-            return {
-                "message": "Player stats requested without an ID.",
-                "recommendations": _fallback(),
-            }
-        return get_player_statistics(player_id)
+def handle_nba_queries(queries: Iterable[str]) -> List[Dict[str, Any]]:
+    """Interpret several queries concurrently.
 
-    if "prop" in normalized or "bet" in normalized or "odds" in normalized:
-        return _fallback()
+    Each query is dispatched through :func:`handle_nba_query` on a shared
+    thread pool so the underlying NBA API requests overlap instead of running
+    back to back. Every query is checked for an NBA reference before any work
+    is submitted, so an invalid query fails without making network calls.
 
-    return _fallback()
+    Parameters
+    ----------
+    queries : iterable of str
+        The user-provided texts to analyse.
 
+    Returns
+    -------
+    list of dict
+        The payloads in the same order as ``queries``.
 
-def _extract_fields(
-    row: Mapping[str, Any],
-    mapping: Mapping[str, tuple[str, type, Any]],
-) -> Dict[str, Any]:
-    """Helper to project and cast values from an API row."""
+    Raises
+    ------
+    ValueError
+        If any query does not contain enough information to map to a helper.
+    """
+
+    queries = list(queries)
+    for query in queries:
+        if not _query_flags(query) & _NBA:
+            raise ValueError("Query does not appear to reference the NBA")
+
+    futures = [_EXECUTOR.submit(handle_nba_query, query) for query in queries]
+    return [future.result() for future in futures]
 
-    extracted: Dict[str, Any] = {}
-    for key, (source, caster, default) in mapping.items():
-        value = row.get(source, default)
-        try:
-            extracted[key] = caster(value if value is not None else default)
-        except (TypeError, ValueError):
-            extracted[key] = default
-    return extracted
+
+def _query_flags(text: str) -> int:
+    """Return the bitmask of keywords that appear anywhere in ``text``."""
+
+    lowered = text.lower()
+    if "nba" not in lowered:
+        return 0
+    flags = _NBA
+    for keyword, bit in _KEYWORD_FLAGS:
+        if keyword in lowered:
+            flags |= bit
+    return flags
 
 
 def _extract_first_integer(text: str) -> Optional[int]:
     """Return the first integer embedded in ``text`` if one exists."""
 
-    match = re.search(r"(\d+)", text)
-    if not match:
-        return None
-    try:
-        return int(match.group(1))
-    except ValueError:
-        return None
+    match = _INT_RE.search(text)
+    return int(match.group()) if match else None
 
 
 def _current_season(today: Optional[date] = None) -> str:
     """Derive the NBA season string (e.g. ``"2023-24"``) for today's date."""
 
     today = today or date.today()
-    year = today.year
-    if today.month >= 10:
+    return _season_for(today.year, today.month)
+
+
+@functools.lru_cache(maxsize=8)
+def _season_for(year: int, month: int) -> str:
+    """Return the NBA season string containing ``month`` of ``year``."""
+
+    if month >= 10:
         start_year = year
     else:
         start_year = year - 1
@@ -495,6 +814,31 @@ def _print_sample_output() -> None:
         print(f"{away} at {home} — {away_score}-{home_score} ({status})")
 
 
+def _write_json(payload: Any) -> None:
+    """Write ``payload`` to stdout as indented JSON followed by a newline.
+
+    With :mod:`orjson` the encoded bytes go straight to the binary stdout
+    buffer; otherwise the stdlib encoder streams chunks to the text stream.
+    Either way no intermediate string copy is built for ``print``.
+    """
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        sys.stdout.flush()
+        buffer.write(
+            orjson.dumps(
+                payload,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+        buffer.flush()
+        return
+
+    json.dump(payload, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 def _build_cli() -> argparse.ArgumentParser:
     """Create the CLI parser for interactive usage."""
 
@@ -525,12 +869,19 @@ def _build_cli() -> argparse.ArgumentParser:
     group.add_argument(
         "--query",
         type=str,
+        action="append",
         metavar="TEXT",
         help=(
             "Interpret a structured natural-language request (e.g. 'live NBA "
-            "scores' or 'team stats for 1610612744')."
+            "scores' or 'team stats for 1610612744'). Repeat to run several "
+            "queries concurrently."
         ),
     )
+    parser.add_argument(
+        "--json-only",
+        action="store_true",
+        help="Write only the JSON payload, skipping the formatted scoreboard.",
+    )
     parser.add_argument(
         "--season",
         type=str,
@@ -553,11 +904,12 @@ def main() -> None:
 
     if args.query:
         try:
-            payload = handle_nba_query(args.query)
+            payloads = handle_nba_queries(args.query)
         except ValueError as exc:
             parser.error(str(exc))
-        print(json.dumps(payload, indent=2))
-        if "games" in payload:
+        payload = payloads[0] if len(payloads) == 1 else payloads
+        _write_json(payload)
+        if not args.json_only and any("games" in item for item in payloads):
             print("\nFormatted output:")
             _print_sample_output()
         return
@@ -568,7 +920,7 @@ def main() -> None:
             season=args.season,
             per_mode=args.per_mode,
         )
-        print(json.dumps(payload, indent=2))
+        _write_json(payload)
         return
 
     if args.team is not None:
@@ -577,7 +929,7 @@ def main() -> None:
             season=args.season,
             per_mode=args.per_mode,
         )
-        print(json.dumps(payload, indent=2))
+        _write_json(payload)
         return
 
     if args.props:
@@ -585,13 +937,14 @@ def main() -> None:
             season=args.season,
             per_mode=args.per_mode,
         )
-        print(json.dumps(payload, indent=2))
+        _write_json(payload)
         return
 
     payload = get_live_scores()
-    print(json.dumps(payload, indent=2))
-    print("\nFormatted output:")
-    _print_sample_output()
+    _write_json(payload)
+    if not args.json_only:
+        print("\nFormatted output:")
+        _print_sample_output()
 
 
 if __name__ == "__main__":